@@ -2,11 +2,16 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from tkinter.font import Font
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import argparse
 import csv
 import os
+import re
 
 class FloralTaskManager:
-    def __init__(self, root):
+    def __init__(self, root, max_loaded_lists=3):
         self.root = root
         self.root.title("Floral Task Manager")
         self.root.geometry("1000x700")
@@ -22,7 +27,19 @@ class FloralTaskManager:
         self.completed_color = "#4CAF50"
         
         # Initialize CSV Data
+        # The default list keeps using tasks.csv; every other named list
+        # lives in its own shard file inside lists_dir.
         self.csv_file = "tasks.csv"
+        self.lists_dir = "task_lists"
+        self.default_list = "Default"
+        self.current_list = self.default_list
+        # Loaded lists in LRU order (most recently opened last)
+        self.loaded_lists = OrderedDict()
+        self.max_loaded_lists = max(1, max_loaded_lists)
+        # Lists whose shard could not be read (never written back) and
+        # lists whose last save failed (never evicted)
+        self.failed_lists = set()
+        self.unsaved_lists = set()
         self.tasks = []
         self.load_tasks()
         
@@ -115,6 +132,9 @@ class FloralTaskManager:
         self.main_frame = ttk.Frame(self.bg_canvas)
         self.main_frame.place(relx=0.5, rely=0.5, anchor="center", width=950, height=650)
         
+        # Task list selector
+        self.create_list_bar()
+        
         # Notebook (Tabs)
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -126,6 +146,26 @@ class FloralTaskManager:
         self.create_delete_tab()
         self.create_filter_tab()
     
+    def create_list_bar(self):
+        """Bar for switching between and creating task lists"""
+        bar = ttk.Frame(self.main_frame)
+        bar.pack(fill="x", padx=10, pady=(10, 0))
+        
+        ttk.Label(bar, text="🌿 Task List:").pack(side="left", padx=(0, 10))
+        self.list_var = tk.StringVar(value=self.current_list)
+        self.list_combobox = ttk.Combobox(bar,
+                                         textvariable=self.list_var,
+                                         state="readonly",
+                                         font=("Helvetica", 11))
+        self.list_combobox.pack(side="left", fill="x", expand=True)
+        self.list_combobox.bind("<<ComboboxSelected>>", self.switch_list)
+        
+        ttk.Button(bar,
+                  text="➕ New List",
+                  command=self.create_list).pack(side="right", padx=(10, 0))
+        
+        self.refresh_list_combobox()
+    
     def create_add_tab(self):
         """Tab for adding new tasks"""
         tab = ttk.Frame(self.notebook)
@@ -342,6 +382,12 @@ class FloralTaskManager:
         self.search_entry = ttk.Entry(filter_frame, font=("Helvetica", 12))
         self.search_entry.grid(row=2, column=1, sticky="ew", pady=5, padx=(0, 10))
         
+        # Cross-list search
+        self.search_all_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame,
+                       text="Search all lists",
+                       variable=self.search_all_var).grid(row=3, column=1, sticky="w", pady=5)
+        
         # Filter Button
         btn_frame = ttk.Frame(tab)
         btn_frame.pack(fill="x", padx=20, pady=10)
@@ -362,6 +408,9 @@ class FloralTaskManager:
     def add_task(self):
 
         """Add a new task to CSV"""
+        if not self.check_list_writable():
+            return
+        
         title = self.title_entry.get().strip()
         description = self.desc_entry.get().strip()
         due_date = self.date_entry.get().strip()
@@ -388,7 +437,9 @@ class FloralTaskManager:
         }
         
         self.tasks.append(new_task)
-        self.save_tasks()
+        if not self.save_tasks():
+            self.refresh_all()
+            return
         
         # Clear form
         self.title_entry.delete(0, tk.END)
@@ -402,6 +453,9 @@ class FloralTaskManager:
     def update_task(self):
 
         """Update an existing task"""
+        if not self.check_list_writable():
+            return
+        
         if not self.current_edit_id:
             messagebox.showwarning("⚠️ Warning", "Please select a task to edit!")
             return
@@ -432,13 +486,18 @@ class FloralTaskManager:
                 })
                 break
         
-        self.save_tasks()
+        if not self.save_tasks():
+            self.refresh_all()
+            return
         messagebox.showinfo("✅ Success", "Task updated successfully!")
         self.refresh_all()
     
     def delete_task(self):
 
         """Delete a task from CSV"""
+        if not self.check_list_writable():
+            return
+        
         selection = self.delete_combobox.get()
         if not selection:
             messagebox.showwarning("⚠️ Warning", "Please select a task to delete!")
@@ -448,13 +507,19 @@ class FloralTaskManager:
         
         if messagebox.askyesno("⚠️ Confirm", "Are you sure you want to delete this task?"):
             self.tasks = [task for task in self.tasks if task["id"] != task_id]
-            self.save_tasks()
+            if not self.save_tasks():
+                self.refresh_all()
+                return
             messagebox.showinfo("✅ Success", "Task deleted successfully!")
             self.refresh_all()
     
     def toggle_task_status(self, task_id):
 
         """Toggle task status between Done/Not Done"""
+        if not self.check_list_writable():
+            self.refresh_tasks()
+            return
+        
         for task in self.tasks:
             if task["id"] == task_id:
                 task["status"] = "Done" if task["status"] == "Not Done" else "Not Done"
@@ -543,6 +608,9 @@ class FloralTaskManager:
         if values:
             self.edit_combobox.current(0)
             self.load_task_for_edit()
+        else:
+            self.edit_combobox.set("")
+            self.clear_edit_form()
     
     def refresh_delete_combobox(self):
         """Update task list in Delete tab"""
@@ -550,6 +618,16 @@ class FloralTaskManager:
         self.delete_combobox["values"] = values
         if values:
             self.delete_combobox.current(0)
+        else:
+            self.delete_combobox.set("")
+    
+    def clear_edit_form(self):
+        """Empty the Edit tab form and forget the edited task"""
+        self.current_edit_id = None
+        self.edit_title_entry.delete(0, tk.END)
+        self.edit_desc_entry.delete(0, tk.END)
+        self.edit_date_entry.delete(0, tk.END)
+        self.edit_status_var.set("")
     
     def apply_filters(self):
         """Apply filters and show results"""
@@ -557,7 +635,25 @@ class FloralTaskManager:
         date_filter = self.filter_date_entry.get().strip()
         search_text = self.search_entry.get().lower().strip()
         
-        filtered_tasks = self.tasks.copy()
+        if date_filter:
+            try:
+                datetime.strptime(date_filter, "%Y-%m-%d")
+            except ValueError:
+                messagebox.showwarning("⚠️ Warning", "Please enter date in YYYY-MM-DD format!")
+                return
+        
+        if self.search_all_var.get():
+            filtered_tasks = self.search_all_lists(status_filter, date_filter, search_text)
+        else:
+            filtered_tasks = self.filter_tasks(self.tasks, status_filter, date_filter, search_text)
+        
+        # Display results
+        self.refresh_filter_results(filtered_tasks)
+    
+    @staticmethod
+    def filter_tasks(tasks, status_filter, date_filter, search_text):
+        """Return the tasks matching the given status, date and title filters"""
+        filtered_tasks = list(tasks)
         
         # Apply status filter
         if status_filter != "All":
@@ -565,19 +661,54 @@ class FloralTaskManager:
         
         # Apply date filter
         if date_filter:
-            try:
-                datetime.strptime(date_filter, "%Y-%m-%d")
-                filtered_tasks = [t for t in filtered_tasks if t["due_date"] == date_filter]
-            except ValueError:
-                messagebox.showwarning("⚠️ Warning", "Please enter date in YYYY-MM-DD format!")
-                return
+            filtered_tasks = [t for t in filtered_tasks if t["due_date"] == date_filter]
         
         # Apply search filter
         if search_text:
             filtered_tasks = [t for t in filtered_tasks if search_text in t["title"].lower()]
         
-        # Display results
-        self.refresh_filter_results(filtered_tasks)
+        return filtered_tasks
+    
+    @staticmethod
+    def due_date_key(task):
+        """Sort key placing dated tasks first, earliest due date first"""
+        return (not task["due_date"], task["due_date"])
+    
+    def search_all_lists(self, status_filter, date_filter, search_text):
+        """Filter every task list in parallel and merge results by due date"""
+        # Snapshot loaded lists here so worker threads never touch live state;
+        # lists that aren't loaded are read straight from their shard file
+        # without being pulled into the LRU cache.
+        sources = []
+        for name in self.get_list_names():
+            if name in self.loaded_lists:
+                sources.append((name, list(self.loaded_lists[name]), None))
+            else:
+                sources.append((name, None, self.list_path(name)))
+        
+        def search_shard(source):
+            name, tasks, path = source
+            if tasks is None:
+                tasks = self.read_tasks_file(path)
+            matches = self.filter_tasks(tasks, status_filter, date_filter, search_text)
+            matches = [dict(task, list=name) for task in matches]
+            matches.sort(key=self.due_date_key)
+            return matches
+        
+        results = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(8, len(sources))) as executor:
+            futures = [(source[0], executor.submit(search_shard, source)) for source in sources]
+            for name, future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    errors.append(f"{name}: {e}")
+        
+        if errors:
+            messagebox.showerror("❌ Error", "Failed to search lists:\n" + "\n".join(errors))
+        
+        return list(heapq.merge(*results, key=self.due_date_key))
     
     def refresh_filter_results(self, tasks=None):
         """Refresh the filtered tasks display"""
@@ -630,8 +761,11 @@ class FloralTaskManager:
             
             # Title with different style if completed
             title_style = "Completed.TLabel" if task["status"] == "Done" else "TLabel"
+            title_text = f"#{task['id']}: {task['title']}"
+            if "list" in task:
+                title_text += f"  🌿 {task['list']}"
             ttk.Label(detail_frame, 
-                     text=f"#{task['id']}: {task['title']}", 
+                     text=title_text, 
                      style=title_style,
                      font=("Helvetica", 11, "bold")).pack(anchor="w")
             
@@ -648,6 +782,11 @@ class FloralTaskManager:
                                      style=title_style)
                 date_label.pack(anchor="w")
     
+    def refresh_list_combobox(self):
+        """Update available task lists in the list selector"""
+        self.list_combobox["values"] = self.get_list_names()
+        self.list_var.set(self.current_list)
+    
     def refresh_all(self):
         """Refresh all UI components"""
         self.refresh_tasks()
@@ -655,40 +794,149 @@ class FloralTaskManager:
         self.refresh_delete_combobox()
         self.apply_filters()
     
+    # ====== Task List Operations ======
+    def switch_list(self, event=None):
+        """Open the task list chosen in the list selector"""
+        name = self.list_var.get()
+        if name and name != self.current_list:
+            self.current_list = name
+            self.clear_edit_form()
+            self.load_tasks()
+            self.refresh_all()
+    
+    def create_list(self):
+        """Create a new, empty task list and open it"""
+        name = simpledialog.askstring("🌿 New List", "List name:", parent=self.root)
+        if name is None:
+            return
+        name = name.strip()
+        
+        if not re.fullmatch(r"[\w\- ]+", name):
+            messagebox.showwarning("⚠️ Warning", "List name may only contain letters, numbers, spaces, - and _!")
+            return
+        
+        # Shard filenames are case-insensitive on Windows and macOS
+        existing = [n.casefold() for n in self.get_list_names()]
+        if name.casefold() in existing:
+            messagebox.showwarning("⚠️ Warning", "A list with this name already exists!")
+            return
+        
+        # Create the shard first; mode "x" never overwrites an existing file
+        try:
+            os.makedirs(self.lists_dir, exist_ok=True)
+            with open(self.list_path(name), mode="x", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=["id", "title", "description", "due_date", "status"])
+                writer.writeheader()
+        except Exception as e:
+            messagebox.showerror("❌ Error", f"Failed to create list: {e}")
+            return
+        
+        self.current_list = name
+        self.clear_edit_form()
+        self.load_tasks()
+        self.refresh_list_combobox()
+        self.refresh_all()
+    
+    def check_list_writable(self):
+        """Warn and return False if the active list failed to load"""
+        if self.current_list in self.failed_lists:
+            messagebox.showwarning("⚠️ Warning", 
+                                   f"The list \"{self.current_list}\" failed to load, so it can't be changed. "
+                                   "Fix its file and reopen the list.")
+            return False
+        return True
+    
+    def get_list_names(self):
+        """Return the default list followed by every shard in lists_dir"""
+        names = []
+        if os.path.isdir(self.lists_dir):
+            names = sorted(os.path.splitext(f)[0]
+                           for f in os.listdir(self.lists_dir) if f.endswith(".csv"))
+        return [self.default_list] + [n for n in names if n != self.default_list]
+    
+    def list_path(self, name):
+        """Return the shard file backing a task list"""
+        if name == self.default_list:
+            return self.csv_file
+        return os.path.join(self.lists_dir, f"{name}.csv")
+    
+    def evict_lists(self):
+        """Drop least recently used inactive lists beyond the memory budget"""
+        # Saved lists can be re-read from their shard; lists with a failed
+        # save are kept so their unsaved changes aren't lost
+        for name in list(self.loaded_lists):
+            if len(self.loaded_lists) <= self.max_loaded_lists:
+                break
+            if name != self.current_list and name not in self.unsaved_lists:
+                del self.loaded_lists[name]
+    
     # ====== CSV Operations ======
     def load_tasks(self):
-        """Load tasks from CSV file"""
-        if os.path.exists(self.csv_file):
+        """Load the active list's tasks, reading its shard only on first use"""
+        if self.current_list in self.loaded_lists:
+            self.loaded_lists.move_to_end(self.current_list)
+        else:
             try:
-                with open(self.csv_file, mode="r", newline="") as file:
-                    reader = csv.DictReader(file)
-                    self.tasks = []
-                    for row in reader:
-                        self.tasks.append({
-                            "id": int(row["id"]),
-                            "title": row["title"],
-                            "description": row["description"],
-                            "due_date": row["due_date"],
-                            "status": row["status"]
-                        })
+                self.loaded_lists[self.current_list] = self.read_tasks_file(self.list_path(self.current_list))
+                self.failed_lists.discard(self.current_list)
             except Exception as e:
+                # Don't cache the failed list so reopening it retries the read
                 messagebox.showerror("❌ Error", f"Failed to load tasks: {e}")
+                self.failed_lists.add(self.current_list)
                 self.tasks = []
-        else:
-            self.tasks = []
+                return
+        self.tasks = self.loaded_lists[self.current_list]
+        self.evict_lists()
+    
+    @staticmethod
+    def read_tasks_file(path):
+        """Read tasks from a CSV shard file"""
+        tasks = []
+        if os.path.exists(path):
+            with open(path, mode="r", newline="") as file:
+                reader = csv.DictReader(file)
+                for row in reader:
+                    tasks.append({
+                        "id": int(row["id"]),
+                        "title": row["title"],
+                        "description": row["description"],
+                        "due_date": row["due_date"],
+                        "status": row["status"]
+                    })
+        return tasks
     
     def save_tasks(self):
-        """Save tasks to CSV file"""
+        """Save the active list's tasks to its CSV shard file, returning success"""
+        # Never write back a list that failed to load, it would wipe its file
+        if not self.check_list_writable():
+            return False
+        
+        self.loaded_lists[self.current_list] = self.tasks
+        self.loaded_lists.move_to_end(self.current_list)
         try:
-            with open(self.csv_file, mode="w", newline="") as file:
+            path = self.list_path(self.current_list)
+            if self.current_list != self.default_list:
+                os.makedirs(self.lists_dir, exist_ok=True)
+            with open(path, mode="w", newline="") as file:
                 writer = csv.DictWriter(file, fieldnames=["id", "title", "description", "due_date", "status"])
                 writer.writeheader()
                 writer.writerows(self.tasks)
+            self.unsaved_lists.discard(self.current_list)
+            saved = True
         except Exception as e:
             messagebox.showerror("❌ Error", f"Failed to save tasks: {e}")
+            self.unsaved_lists.add(self.current_list)
+            saved = False
+        self.evict_lists()
+        return saved
 
 # ====== Run the App ======
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Floral Task Manager")
+    parser.add_argument("--max-loaded-lists", type=int, default=3,
+                        help="number of task lists kept in memory (default: 3)")
+    args = parser.parse_args()
+    
     root = tk.Tk()
-    app = FloralTaskManager(root)
+    app = FloralTaskManager(root, max_loaded_lists=args.max_loaded_lists)
     root.mainloop()
\ No newline at end of file